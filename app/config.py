@@ -9,13 +9,21 @@ class Settings:
     CLOUDINARY_API_KEY = os.getenv("CLOUDINARY_API_KEY")
     CLOUDINARY_API_SECRET = os.getenv("CLOUDINARY_API_SECRET")
     PORT = int(os.getenv("PORT", 8000))
-
-    ALLOWED_MIME_TYPES = {
-        "application/pdf": ".pdf",
-        "text/plain": ".txt",
-        "application/msword": ".doc",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
-    }
+    SUMMARIZER_MODEL = os.getenv("SUMMARIZER_MODEL", "sshleifer/distilbart-cnn-12-6")
+    MODEL_CACHE_DIR = os.getenv("MODEL_CACHE_DIR")
+    CT2_MODEL_DIR = os.getenv("CT2_MODEL_DIR")
+    RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", 256))
+    # Upload scratch space. Point at a tmpfs mount only if it is sized for the
+    # largest expected PDF plus its DOCX; it counts against container memory.
+    TEMP_DIR = os.getenv("TEMP_DIR", "/tmp")
+    # Processes per pool, per gunicorn worker. Each worker has two pools
+    # (extraction and conversion), so up to WEB_CONCURRENCY * 2 *
+    # PDF_CONCURRENCY PDF processes can exist; the default splits the cores
+    # between workers.
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 2))
+    PDF_CONCURRENCY = int(
+        os.getenv("PDF_CONCURRENCY", max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY))
+    )
 
 
 settings = Settings()
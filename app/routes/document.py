@@ -1,3 +1,9 @@
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import Callable, Dict
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from ..config import settings
 from ..services.summarizer import summarizer
@@ -7,31 +13,47 @@ from ..services.extractor import (
     extract_text_from_txt,
 )
 from ..services.converter import convert_pdf_to_docx
+from ..utils.cache import LRUCache
+from ..utils.files import save_upload
 
 router = APIRouter()
 
+# Both endpoints are pure functions of the uploaded bytes, so responses are
+# cached by content hash.
+_summary_cache: LRUCache[str] = LRUCache(settings.RESPONSE_CACHE_SIZE)
+_docx_url_cache: LRUCache[str] = LRUCache(settings.RESPONSE_CACHE_SIZE)
+
+_EXTRACTORS: Dict[str, Callable[[bytes], str]] = {
+    "application/pdf": extract_text_from_pdf,
+    "text/plain": extract_text_from_txt,
+    "application/msword": extract_text_from_docx,
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": extract_text_from_docx,
+}
+
 
 @router.post("/summarize")
 async def summarize_document(file: UploadFile = File(...)):
     """Extract and summarize text from a document."""
-    if file.content_type not in settings.ALLOWED_MIME_TYPES:
+    extractor = _EXTRACTORS.get(file.content_type)
+    if extractor is None:
         raise HTTPException(status_code=400, detail="Unsupported file type.")
 
     contents = await file.read()
-    extractors = {
-        "application/pdf": extract_text_from_pdf,
-        "text/plain": extract_text_from_txt,
-        "application/msword": extract_text_from_docx,
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": extract_text_from_docx,
-    }
-
-    extracted_text = extractors[file.content_type](contents)
+    cache_key = (hashlib.sha256(contents).hexdigest(), file.content_type)
+    summary = _summary_cache.get(cache_key)
+    if summary:
+        return {"filename": file.filename, "summary": summary}
+
+    # Extraction is CPU-bound and may wait on the PDF process pool; keep it
+    # off the event loop.
+    extracted_text = await asyncio.to_thread(extractor, contents)
     if not extracted_text:
         raise HTTPException(status_code=400, detail="No text extracted")
 
-    summary = summarizer.generate_summary(extracted_text)
+    summary = await asyncio.to_thread(summarizer.generate_summary, extracted_text)
     if not summary:
         raise HTTPException(status_code=400, detail="Could not generate summary")
+    _summary_cache.set(cache_key, summary)
 
     return {"filename": file.filename, "summary": summary}
 
@@ -42,12 +64,20 @@ async def convert_pdf_to_word(file: UploadFile = File(...)):
     if not file.filename.endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
 
-    contents = await file.read()
-    docx_url = convert_pdf_to_docx(contents)
+    temp_dir = tempfile.mkdtemp(dir=settings.TEMP_DIR)
+    try:
+        pdf_path = os.path.join(temp_dir, "input.pdf")
+        digest = await save_upload(file, pdf_path)
+        docx_url = _docx_url_cache.get(digest) or await convert_pdf_to_docx(
+            pdf_path
+        )
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
     if not docx_url:
         raise HTTPException(
             status_code=400, detail="Failed to upload converted document."
         )
+    _docx_url_cache.set(digest, docx_url)
 
     return {"docx_url": docx_url}
@@ -1,3 +1,4 @@
+import asyncio
 import cloudinary
 import cloudinary.uploader
 from ..config import settings
@@ -12,9 +13,14 @@ def init_cloudinary():
     )
 
 
-def upload_to_cloudinary(file_path: str, resource_type: str = "raw") -> str:
+async def upload_to_cloudinary(file_path: str, resource_type: str = "raw") -> str:
     """Upload a file to Cloudinary and return the URL."""
-    result = cloudinary.uploader.upload(
-        file_path, resource_type, use_filename=True, unique_filename=True
+    # The SDK is blocking; run it on a worker thread to keep the loop free.
+    result = await asyncio.to_thread(
+        cloudinary.uploader.upload,
+        file_path,
+        resource_type=resource_type,
+        use_filename=True,
+        unique_filename=True,
     )
     return result.get("secure_url", "")
@@ -1,29 +1,31 @@
+import asyncio
 import os
-import tempfile
 from pdf2docx import Converter
 from .cloudinary import upload_to_cloudinary
+from ..utils.pool import process_pool
 
 
-def convert_pdf_to_docx(file_bytes: bytes) -> str:
-    """Convert PDF to Docx and upload to Cloudinary."""
-    temp_dir = tempfile.mkdtemp(dir="/tmp")
-    pdf_path = os.path.join(temp_dir, "input.pdf")
-    docx_path = os.path.join(temp_dir, "output.pdf")
-
+def _convert(pdf_path: str, docx_path: str) -> None:
+    """Run pdf2docx; executed in a worker process."""
+    cv = Converter(pdf_path)
     try:
-        with open(pdf_path, "wb") as pdf_file:
-            pdf_file.write(file_bytes)
-
-        cv = Converter(pdf_path)
         cv.convert(docx_path)
+    finally:
         cv.close()
 
-        docx_url = upload_to_cloudinary(docx_path)
+
+async def convert_pdf_to_docx(pdf_path: str) -> str:
+    """Convert PDF to Docx and upload to Cloudinary."""
+    docx_path = os.path.splitext(pdf_path)[0] + ".docx"
+
+    try:
+        loop = asyncio.get_running_loop()
+        with process_pool("convert") as pool:
+            await loop.run_in_executor(pool, _convert, pdf_path, docx_path)
+
+        docx_url = await upload_to_cloudinary(docx_path)
         return docx_url
     finally:
         # Cleanup
-        for path in [pdf_path, docx_path]:
-            if os.path.exists(path):
-                os.remove(path)
-        if os.path.exists(temp_dir):
-            os.rmdir(temp_dir)
+        if os.path.exists(docx_path):
+            os.remove(docx_path)
@@ -1,19 +1,74 @@
 import io
-import PyPDF2
+import threading
+from itertools import repeat
 import docx
+import pypdfium2 as pdfium
+from ..config import settings
+from ..utils.pool import process_pool
 from ..utils.text import clean_text
 
+# Below this many pages per worker, process start-up and pickling the PDF
+# bytes cost more than extracting the pages in-process.
+_MIN_PAGES_PER_WORKER = 8
+
+# PDFium forbids concurrent calls from different threads, even on different
+# documents, and extraction runs on the default thread pool.
+_pdfium_lock = threading.Lock()
+
 
 def extract_text_from_pdf(file_bytes: bytes) -> str:
     """Extract text from PDF."""
-    pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_bytes))
-    return clean_text(" ".join(page.extract_text() or "" for page in pdf_reader.pages))
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(file_bytes)
+        try:
+            n_pages = len(pdf)
+            workers = min(settings.PDF_CONCURRENCY, n_pages // _MIN_PAGES_PER_WORKER)
+            if workers <= 1:
+                return clean_text(_extract_page_range_text(pdf, 0, n_pages))
+        finally:
+            pdf.close()
+
+    # Each worker re-opens the document and extracts a contiguous page range;
+    # PDFium is not thread-safe, so processes are the only way to fan out.
+    step = -(-n_pages // workers)
+    starts = range(0, n_pages, step)
+    stops = [min(start + step, n_pages) for start in starts]
+    with process_pool("extract") as pool:
+        parts = pool.map(_extract_pdf_pages, repeat(file_bytes), starts, stops)
+        text = " ".join(parts)
+    return clean_text(text)
+
+
+def _extract_pdf_pages(file_bytes: bytes, start: int, stop: int) -> str:
+    """Extract text from pages [start, stop) of a PDF in a worker process."""
+    pdf = pdfium.PdfDocument(file_bytes)
+    try:
+        return _extract_page_range_text(pdf, start, stop)
+    finally:
+        pdf.close()
+
+
+def _extract_page_range_text(pdf: pdfium.PdfDocument, start: int, stop: int) -> str:
+    """Extract text from pages [start, stop) of an open PDF."""
+    return " ".join(_extract_page_text(pdf[i]) for i in range(start, stop))
+
+
+def _extract_page_text(page: pdfium.PdfPage) -> str:
+    """Extract text from a single PDF page."""
+    textpage = page.get_textpage()
+    try:
+        return textpage.get_text_range()
+    finally:
+        textpage.close()
+        page.close()
 
 
 def extract_text_from_docx(file_bytes: bytes) -> str:
     """Extreact text from Docx."""
+    # BytesIO(bytes) shares the caller's buffer until written to, so this is
+    # not a copy; rewriting a pooled buffer would add one.
     doc = docx.Document(io.BytesIO(file_bytes))
-    return clean_text(" ".join(p.text for p in doc.paragraph))
+    return clean_text(" ".join(p.text for p in doc.paragraphs))
 
 
 def extract_text_from_txt(file_bytes: bytes) -> str:
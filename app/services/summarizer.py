@@ -1,24 +1,197 @@
-from transformers import pipeline
+import os
+import shutil
+import tempfile
+import threading
+from typing import List
+import torch
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
+from transformers.utils import cached_file, extract_commit_hash
+from ..config import settings
+
+# Make torch.cuda.is_available() ask NVML instead of initialising CUDA, so
+# calling it never poisons a process that gunicorn later forks. torch reads
+# this on each call, not at import.
+os.environ.setdefault("PYTORCH_NVML_BASED_CUDA_CHECK", "1")
+
+
+def _select_cuda_dtype() -> torch.dtype:
+    """Pick the cheapest dtype the GPU runs well; initialises CUDA."""
+    if torch.cuda.is_bf16_supported():
+        return torch.bfloat16
+    return torch.float16
+
+
+def _safetensors_checkpoint(model_name: str) -> str:
+    """Return a local safetensors export of model_name, converting it once.
+
+    Some checkpoints (distilbart among them) only ship pickled .bin weights,
+    which cannot be memory-mapped. The export is fp32, the dtype the model
+    is loaded in on CPU, so the load maps it without converting. Exports are
+    keyed by the upstream commit, so a new revision is exported afresh.
+    """
+    # Resolving config.json checks the hub for a newer commit (or uses the
+    # cache when offline) and yields the commit hash it came from.
+    config_file = cached_file(
+        model_name, "config.json", cache_dir=settings.MODEL_CACHE_DIR
+    )
+    commit = extract_commit_hash(config_file, None)
+    root = settings.MODEL_CACHE_DIR or os.path.join(
+        os.path.expanduser("~"), ".cache", "summarizer"
+    )
+    path = os.path.join(
+        root, "safetensors", model_name.replace("/", "--"), commit or "local"
+    )
+    if os.path.isdir(path):
+        return path
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Export next to the target so the final rename is atomic.
+    staging = tempfile.mkdtemp(dir=os.path.dirname(path))
+    try:
+        model = AutoModelForSeq2SeqLM.from_pretrained(
+            model_name,
+            revision=commit,
+            cache_dir=settings.MODEL_CACHE_DIR,
+            torch_dtype=torch.float32,
+        )
+        model.save_pretrained(staging, safe_serialization=True)
+        tokenizer = AutoTokenizer.from_pretrained(
+            model_name,
+            revision=commit,
+            cache_dir=settings.MODEL_CACHE_DIR,
+        )
+        tokenizer.save_pretrained(staging)
+        del model
+        os.rename(staging, path)
+    except OSError:
+        # Another process finished the export first.
+        if not os.path.isdir(path):
+            raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return path
 
 
 class Summarizer:
+    BATCH_SIZE = 8
+    # BART's encoder takes 1024 tokens; leave room for BOS/EOS on re-encode.
+    MAX_CHUNK_TOKENS = 1000
+    MIN_CHUNK_TOKENS = 50
+    MAX_SUMMARY_TOKENS = 130
+    MIN_SUMMARY_TOKENS = 30
+
     def __init__(self) -> None:
-        self.model = pipeline("summarization", model="facebook/bart-large-cnn")
+        # Everything here runs in the gunicorn master under --preload, so it
+        # must not touch CUDA: CUDA state does not survive fork. The model is
+        # built on CPU in fp32 and workers move it to the GPU in to_device().
+        self.model = None
+        self.translator = None
+        # Requests call in from the thread pool; the model and the fast
+        # tokenizer are not safe to drive from several threads at once.
+        self._lock = threading.Lock()
+        if settings.CT2_MODEL_DIR:
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                settings.SUMMARIZER_MODEL, cache_dir=settings.MODEL_CACHE_DIR
+            )
+        else:
+            self.model = pipeline(
+                "summarization",
+                model=_safetensors_checkpoint(settings.SUMMARIZER_MODEL),
+                device=-1,
+                torch_dtype=torch.float32,
+                batch_size=self.BATCH_SIZE,
+                model_kwargs={"use_safetensors": True, "low_cpu_mem_usage": True},
+            )
+            self.tokenizer = self.model.tokenizer
+
+    def to_device(self) -> None:
+        """Place the model on its inference device; call once per worker."""
+        with self._lock:
+            if settings.CT2_MODEL_DIR:
+                if self.translator is None:
+                    self._load_translator()
+            elif torch.cuda.is_available():
+                device = torch.device("cuda", 0)
+                self.model.model.to(device, _select_cuda_dtype())
+                self.model.device = device
+
+    def _load_translator(self) -> None:
+        """Create the optional CTranslate2 backend for CT2_MODEL_DIR."""
+        import ctranslate2
+
+        self.translator = ctranslate2.Translator(
+            settings.CT2_MODEL_DIR,
+            device="cuda" if torch.cuda.is_available() else "cpu",
+            compute_type="auto",
+        )
 
     def generate_summary(self, text: str) -> str:
         """Generate text summary."""
-        max_chunk_length = 1024
-        chunks = [
-            text[i : i + max_chunk_length]
-            for i in range(0, len(text), max_chunk_length)
+        with self._lock:
+            return self._generate_summary(text)
+
+    def _generate_summary(self, text: str) -> str:
+        """Generate text summary; caller holds self._lock."""
+        ids = self.tokenizer(text, add_special_tokens=False).input_ids
+        windows = [
+            ids[i : i + self.MAX_CHUNK_TOKENS]
+            for i in range(0, len(ids), self.MAX_CHUNK_TOKENS)
+            # Only the final window can fall short of the full size.
+            if min(len(ids) - i, self.MAX_CHUNK_TOKENS) >= self.MIN_CHUNK_TOKENS
         ]
-        return " ".join(
-            self.model(chunk, max_length=130, min_length=30, do_sample=False)[0][
-                "summary_text"
-            ]
-            for chunk in chunks
-            if len(chunk.split()) >= 50
+        if not windows:
+            return ""
+
+        if settings.CT2_MODEL_DIR:
+            # Callers that skip the startup hook never ran to_device().
+            if self.translator is None:
+                self._load_translator()
+            summaries = self._summarize_ct2(windows)
+        else:
+            summaries = self._summarize_pipeline(windows)
+        return " ".join(summaries)
+
+    def _summarize_pipeline(self, windows: List[List[int]]) -> List[str]:
+        """Summarize token windows with the transformers pipeline."""
+        results = self.model(
+            [self.tokenizer.decode(window) for window in windows],
+            max_length=self.MAX_SUMMARY_TOKENS,
+            min_length=self.MIN_SUMMARY_TOKENS,
+            do_sample=False,
+            num_beams=1,
+            use_cache=True,
+            batch_size=self.BATCH_SIZE,
+            truncation=True,
         )
+        return [result["summary_text"] for result in results]
+
+    def _summarize_ct2(self, windows: List[List[int]]) -> List[str]:
+        """Summarize token windows with CTranslate2, skipping re-tokenization."""
+        tokenizer = self.tokenizer
+        sources = [
+            tokenizer.convert_ids_to_tokens(
+                tokenizer.build_inputs_with_special_tokens(window)
+            )
+            for window in windows
+        ]
+        results = self.translator.translate_batch(
+            sources,
+            max_batch_size=self.BATCH_SIZE,
+            beam_size=1,
+            max_decoding_length=self.MAX_SUMMARY_TOKENS,
+            min_decoding_length=self.MIN_SUMMARY_TOKENS,
+        )
+        return [
+            tokenizer.decode(
+                tokenizer.convert_tokens_to_ids(result.hypotheses[0]),
+                skip_special_tokens=True,
+            )
+            for result in results
+        ]
+
+    def warmup(self) -> None:
+        """Run one throwaway summary so the first request skips lazy init."""
+        self.generate_summary("warmup " * (self.MIN_CHUNK_TOKENS * 2))
 
 
 summarizer = Summarizer()
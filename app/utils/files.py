@@ -0,0 +1,15 @@
+import hashlib
+import aiofiles
+from fastapi import UploadFile
+
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+async def save_upload(file: UploadFile, path: str) -> str:
+    """Stream an uploaded file to disk and return its SHA-256 hex digest."""
+    digest = hashlib.sha256()
+    async with aiofiles.open(path, "wb") as out:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            await out.write(chunk)
+    return digest.hexdigest()
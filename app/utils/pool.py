@@ -0,0 +1,48 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Dict, Iterator
+from ..config import settings
+
+_process_pools: Dict[str, ProcessPoolExecutor] = {}
+# Pools are requested from the request thread pool as well as the loop.
+_pools_lock = threading.Lock()
+
+
+def get_process_pool(name: str) -> ProcessPoolExecutor:
+    """Return the named pool for CPU-bound PDF work, creating it on first use.
+
+    Each kind of job gets its own pool so long conversions cannot starve
+    text extraction of workers.
+    """
+    with _pools_lock:
+        pool = _process_pools.get(name)
+        if pool is None:
+            # Workers come from a clean forkserver rather than forking this
+            # process, which is threaded and has torch/CUDA loaded.
+            pool = _process_pools[name] = ProcessPoolExecutor(
+                max_workers=settings.PDF_CONCURRENCY,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return pool
+
+
+@contextmanager
+def process_pool(name: str) -> Iterator[ProcessPoolExecutor]:
+    """Yield the named pool, replacing it if a child dies while in use.
+
+    A crashed child (e.g. a native parser segfaulting on a malformed upload)
+    leaves the executor permanently broken; the failing call still raises,
+    but the next one gets a fresh pool.
+    """
+    pool = get_process_pool(name)
+    try:
+        yield pool
+    except BrokenProcessPool:
+        with _pools_lock:
+            if _process_pools.get(name) is pool:
+                del _process_pools[name]
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
@@ -1,8 +1,11 @@
 import re
 
+_WHITESPACE = re.compile(r"\s+")
+# Whitespace is already collapsed to single spaces when this runs.
+_SPACE_BEFORE_PUNCT = re.compile(r" (?=[.,!?])")
+
 
 def clean_text(text: str) -> str:
     """Clean extracted texts."""
-    text = re.sub(r"\s+", " ", text).strip()
-    text = re.sub(r"\s+([.,!?])", r"\1", text)
-    return text
+    text = _WHITESPACE.sub(" ", text).strip()
+    return _SPACE_BEFORE_PUNCT.sub("", text)
@@ -1,12 +1,17 @@
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from app.config import settings
 from app.services.cloudinary import init_cloudinary
+from app.services.summarizer import summarizer
 from app.routes import document, health
 
 
 # Initialize FastAPI App.
-app = FastAPI(title="Document Processing API")
+app = FastAPI(
+    title="Document Processing API", default_response_class=ORJSONResponse
+)
 
 
 # Configure CORS for Frontend
@@ -23,8 +28,16 @@ app.add_middleware(
 init_cloudinary()
 
 # Creatre temporary directory
-os.makedirs("/tmp", exist_ok=True)
+os.makedirs(settings.TEMP_DIR, exist_ok=True)
 
 # Include routers
 app.include_router(document.router, tags=["documents"])
 app.include_router(health.router, tags=["health"])
+
+
+@app.on_event("startup")
+async def warmup_summarizer():
+    """Move the model to its device and pay the first-call cost up front."""
+    # Runs in each worker after gunicorn forks, so CUDA is initialised here.
+    summarizer.to_device()
+    summarizer.warmup()